@@ -0,0 +1,28 @@
+"""Add composite expense index for group listings
+
+Revision ID: 3d5e8b1f4c27
+Revises: c90049fcd30e
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3d5e8b1f4c27"
+down_revision: Union[str, Sequence[str], None] = "c90049fcd30e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_expense_group_id_created_at", "expense", ["group_id", "created_at"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_expense_group_id_created_at", table_name="expense")
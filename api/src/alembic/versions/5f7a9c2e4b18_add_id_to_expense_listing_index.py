@@ -0,0 +1,30 @@
+"""Add id to the expense listing index for keyset pagination
+
+Revision ID: 5f7a9c2e4b18
+Revises: 8b2d4f6a1c93
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5f7a9c2e4b18"
+down_revision: Union[str, Sequence[str], None] = "8b2d4f6a1c93"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_expense_group_id_created_at_id", "expense", ["group_id", "created_at", "id"])
+    op.drop_index("ix_expense_group_id_created_at", table_name="expense")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index("ix_expense_group_id_created_at", "expense", ["group_id", "created_at"])
+    op.drop_index("ix_expense_group_id_created_at_id", table_name="expense")
@@ -0,0 +1,30 @@
+"""Replace user google_id unique constraint with a unique index
+
+Revision ID: 6a6f35b71716
+Revises: a1b2c3d4e5f6
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "6a6f35b71716"
+down_revision: Union[str, Sequence[str], None] = "a1b2c3d4e5f6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_constraint("uq_user_google_id", "user", type_="unique")
+    op.create_index(op.f("ix_user_google_id"), "user", ["google_id"], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_user_google_id"), table_name="user")
+    op.create_unique_constraint("uq_user_google_id", "user", ["google_id"])
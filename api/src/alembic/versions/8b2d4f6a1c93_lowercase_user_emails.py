@@ -0,0 +1,46 @@
+"""Lowercase stored user emails
+
+Revision ID: 8b2d4f6a1c93
+Revises: 3d5e8b1f4c27
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8b2d4f6a1c93"
+down_revision: Union[str, Sequence[str], None] = "3d5e8b1f4c27"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Accounts whose emails only differ in case would collide on the unique index once lowercased
+    conflicts = (
+        op.get_bind()
+        .execute(
+            sa.text(
+                "SELECT lower(email), string_agg(email, ', ' ORDER BY email) FROM \"user\" "
+                "GROUP BY lower(email) HAVING count(*) > 1 ORDER BY 1"
+            )
+        )
+        .all()
+    )
+    if conflicts:
+        details = "; ".join(f"{email}: {accounts}" for email, accounts in conflicts)
+        raise RuntimeError(
+            f"Cannot lowercase user emails, these accounts only differ in case and must be merged first: {details}"
+        )
+    op.execute('UPDATE "user" SET email = lower(email) WHERE email <> lower(email)')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # The original casing is not kept, lowercased emails remain valid
+    pass
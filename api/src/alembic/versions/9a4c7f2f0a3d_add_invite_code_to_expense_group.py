@@ -27,19 +27,19 @@ def upgrade() -> None:
 
     connection = op.get_bind()
     expense_groups = connection.execute(sa.text("SELECT id FROM expensegroup")).fetchall()
-    existing_codes: set[str] = set()
     alphabet = "23456789ABCDEFGHJKLMNPQRSTUVWXYZ"
     code_length = 10
+    translation_table = bytes(ord(alphabet[byte & 0x1F]) for byte in range(256))
 
-    for (group_id,) in expense_groups:
-        while True:
-            code = "".join(secrets.choice(alphabet) for _ in range(code_length))
-            if code not in existing_codes:
-                existing_codes.add(code)
-                break
-        connection.execute(
-            sa.text("UPDATE expensegroup SET invite_code = :code WHERE id = :id"), {"code": code, "id": group_id}
-        )
+    codes: set[str] = set()
+    while len(codes) < len(expense_groups):
+        missing = len(expense_groups) - len(codes)
+        symbols = secrets.token_bytes(missing * code_length).translate(translation_table).decode()
+        codes.update(symbols[index : index + code_length] for index in range(0, len(symbols), code_length))
+
+    updates = [{"code": code, "id": group_id} for (group_id,), code in zip(expense_groups, codes)]
+    if updates:
+        connection.execute(sa.text("UPDATE expensegroup SET invite_code = :code WHERE id = :id"), updates)
 
     op.alter_column("expensegroup", "invite_code", nullable=False)
     op.create_unique_constraint("uq_expensegroup_invite_code", "expensegroup", ["invite_code"])
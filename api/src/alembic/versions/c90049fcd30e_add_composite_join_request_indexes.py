@@ -0,0 +1,36 @@
+"""Replace expense_group_join_request single-column indexes with composite indexes
+
+Revision ID: c90049fcd30e
+Revises: 6a6f35b71716
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c90049fcd30e"
+down_revision: Union[str, Sequence[str], None] = "6a6f35b71716"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_expensegroupjoinrequest_group_id_status", "expensegroupjoinrequest", ["group_id", "status"])
+    op.create_index("ix_expensegroupjoinrequest_user_id_status", "expensegroupjoinrequest", ["user_id", "status"])
+    op.drop_index("ix_expensegroupjoinrequest_status", table_name="expensegroupjoinrequest")
+    op.drop_index("ix_expensegroupjoinrequest_user_id", table_name="expensegroupjoinrequest")
+    op.drop_index("ix_expensegroupjoinrequest_group_id", table_name="expensegroupjoinrequest")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index("ix_expensegroupjoinrequest_group_id", "expensegroupjoinrequest", ["group_id"])
+    op.create_index("ix_expensegroupjoinrequest_user_id", "expensegroupjoinrequest", ["user_id"])
+    op.create_index("ix_expensegroupjoinrequest_status", "expensegroupjoinrequest", ["status"])
+    op.drop_index("ix_expensegroupjoinrequest_user_id_status", table_name="expensegroupjoinrequest")
+    op.drop_index("ix_expensegroupjoinrequest_group_id_status", table_name="expensegroupjoinrequest")
@@ -1,9 +1,15 @@
+from hashlib import sha256
+from threading import Lock
+from time import time
 from jwt import InvalidTokenError
 import jwt
 from fastapi import Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from typing import Annotated
 from fastapi.security import OAuth2PasswordBearer
+from sqlmodel import Session
 
+from auth.security import get_signing_key
 from auth.service import get_user_by_id
 from core.conf import get_settings
 from db.dependencies import DbSession
@@ -11,20 +17,61 @@ from db.dependencies import DbSession
 from .models import User
 
 
+TOKEN_CACHE_MAX_SIZE = 10_000
+
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/token/")
 
+# Maps a token digest to the user id it was issued for and the time until which that result can be reused
+token_cache: dict[bytes, tuple[int, float]] = {}
+# Lookups run on threadpool workers, so reads and writes of the cache are serialized
+token_cache_lock = Lock()
+
+
+def get_token_user_id(token: str) -> int | None:
+    """Decode an access token and return its subject, reusing recent results for the same token."""
+    cache_key = sha256(token.encode()).digest()
+    now = time()
+    with token_cache_lock:
+        if cached := token_cache.get(cache_key):
+            if cached[1] > now:
+                return cached[0]
+            del token_cache[cache_key]
 
-async def get_authenticated_user(session: DbSession, token: Annotated[str, Depends(oauth2_scheme)]) -> User:
     settings = get_settings()
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials", headers={"WWW-Authenticate": "Bearer"}
-    )
     try:
-        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.access_token_hashing_algorithm])
+        payload = jwt.decode(token, get_signing_key(), algorithms=[settings.access_token_hashing_algorithm])
     except InvalidTokenError:
-        raise credentials_exception
-    if not (user_id := payload.get("sub")) or not (user := get_user_by_id(session=session, user_id=int(user_id))):
-        raise credentials_exception
+        return None
+    if not (subject := payload.get("sub")):
+        return None
+
+    user_id = int(subject)
+    if settings.access_token_cache_ttl_seconds <= 0:
+        return user_id
+    expires_at = now + settings.access_token_cache_ttl_seconds
+    with token_cache_lock:
+        # Expired entries are dropped when read, a full cache evicts in insertion order so each insert stays O(1)
+        token_cache.pop(cache_key, None)
+        if len(token_cache) >= TOKEN_CACHE_MAX_SIZE:
+            del token_cache[next(iter(token_cache))]
+        token_cache[cache_key] = (user_id, min(expires_at, payload.get("exp", expires_at)))
+    return user_id
+
+
+def _resolve_user(session: Session, token: str) -> User | None:
+    if (user_id := get_token_user_id(token)) is None:
+        return None
+    return get_user_by_id(session=session, user_id=user_id)
+
+
+async def get_authenticated_user(session: DbSession, token: Annotated[str, Depends(oauth2_scheme)]) -> User:
+    # Signature verification and the user lookup are blocking, so keep them off the event loop
+    if not (user := await run_in_threadpool(_resolve_user, session, token)):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
     return user
 
 
@@ -1,4 +1,4 @@
-from pydantic import EmailStr, BaseModel
+from pydantic import EmailStr, BaseModel, field_validator
 from sqlmodel import Field, SQLModel
 
 
@@ -6,11 +6,16 @@ class UserBase(SQLModel):
     name: str
     email: EmailStr = Field(unique=True, index=True)
 
+    @field_validator("email")
+    @classmethod
+    def _normalize_email(cls, email: str) -> str:
+        return email.lower()
+
 
 class User(UserBase, table=True):
     id: int | None = Field(default=None, primary_key=True)
     hashed_password: str | None = Field(default=None)
-    google_id: str | None = Field(default=None, unique=True)
+    google_id: str | None = Field(default=None, unique=True, index=True)
 
 
 class UserCreate(UserBase):
@@ -25,6 +30,13 @@ class UserUpdate(SQLModel):
     name: str | None = None
     email: EmailStr | None = None
 
+    @field_validator("email")
+    @classmethod
+    def _normalize_email(cls, email: str | None) -> str | None:
+        if email is None:
+            return None
+        return email.lower()
+
 
 class Token(BaseModel):
     access_token: str
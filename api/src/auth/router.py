@@ -1,32 +1,36 @@
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import RedirectResponse
 from fastapi.security import OAuth2PasswordRequestForm
 
 from auth.dependencies import AuthenticatedUser
 from core.conf import get_settings
+from core.dependencies import HttpClient
 from db.dependencies import DbSession
 
 from .google import exchange_code_for_tokens, get_google_oauth_url, get_google_user_info
 from .models import Token, User, UserCreate, UserPublic, UserUpdate
 from .security import create_access_token, verify_password
-from .service import create_user, get_or_create_user_by_google, get_user_by_email, update_user
+from .service import create_user, email_exists, get_or_create_user_by_google, get_user_by_email, update_user
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
 @router.post("/register/", response_model=UserPublic, status_code=status.HTTP_201_CREATED)
-async def register(*, session: DbSession, user_in: UserCreate) -> User:
-    if get_user_by_email(session=session, email=user_in.email):
+def register(*, session: DbSession, user_in: UserCreate) -> User:
+    if email_exists(session=session, email=user_in.email):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="A user with this email already exists")
     return create_user(session=session, user_in=user_in)
 
 
 @router.post("/token/", response_model=Token)
-async def login(*, session: DbSession, form_data: Annotated[OAuth2PasswordRequestForm, Depends()]) -> Token:
+def login(*, session: DbSession, form_data: Annotated[OAuth2PasswordRequestForm, Depends()]) -> Token:
     user = get_user_by_email(session=session, email=form_data.username)
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    # Always verify a password, even for unknown emails, so response times do not reveal which accounts exist
+    password_valid = verify_password(form_data.password, user.hashed_password if user else None)
+    if not user or not password_valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -45,11 +49,7 @@ async def get_authenticated_user_data(*, authenticated_user: AuthenticatedUser)
 def update_authenticated_user(
     *, session: DbSession, authenticated_user: AuthenticatedUser, user_in: UserUpdate
 ) -> User:
-    if (
-        user_in.email
-        and (user := get_user_by_email(session=session, email=user_in.email))
-        and user.id != authenticated_user.id
-    ):
+    if user_in.email and email_exists(session=session, email=user_in.email, exclude_user_id=authenticated_user.id):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="A user with this email already exists")
     return update_user(session=session, user=authenticated_user, user_in=user_in)
 
@@ -64,14 +64,15 @@ async def google_login() -> RedirectResponse:
 
 
 @router.get("/google/callback")
-async def google_callback(*, session: DbSession, code: str) -> RedirectResponse:
+async def google_callback(*, session: DbSession, http_client: HttpClient, code: str) -> RedirectResponse:
     settings = get_settings()
     try:
-        token_data = await exchange_code_for_tokens(code)
-        user_info = await get_google_user_info(token_data["access_token"])
-        user = get_or_create_user_by_google(
+        token_data = await exchange_code_for_tokens(http_client, code)
+        user_info = get_google_user_info(token_data["id_token"])
+        user = await run_in_threadpool(
+            get_or_create_user_by_google,
             session=session,
-            google_id=user_info["id"],
+            google_id=user_info["sub"],
             email=user_info["email"],
             name=user_info.get("name", user_info["email"]),
         )
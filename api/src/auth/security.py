@@ -1,28 +1,53 @@
-from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from time import time
 
 import jwt
+from jwt.utils import base64url_encode
 from pwdlib import PasswordHash
+from pwdlib.hashers.argon2 import Argon2Hasher
 
 from auth.models import User
 from core.conf import get_settings
 
-password_hash = PasswordHash.recommended()
+
+@lru_cache
+def _build_password_hash(time_cost: int, memory_cost: int, parallelism: int) -> tuple[PasswordHash, str]:
+    password_hash = PasswordHash((Argon2Hasher(time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism),))
+    dummy_hash = password_hash.hash("dummy-password")
+    return password_hash, dummy_hash
+
+
+def get_password_hasher() -> tuple[PasswordHash, str]:
+    """Get the password hasher for the configured Argon2 parameters along with its dummy hash."""
+    settings = get_settings()
+    return _build_password_hash(settings.argon2_time_cost, settings.argon2_memory_cost, settings.argon2_parallelism)
 
 
 def verify_password(plain_password: str, hashed_password: str | None) -> bool:
+    password_hash, dummy_hash = get_password_hasher()
     if hashed_password is None:
+        password_hash.verify(plain_password, dummy_hash)
         return False
     return password_hash.verify(plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
+    password_hash, _ = get_password_hasher()
     return password_hash.hash(password)
 
 
+@lru_cache
+def _build_signing_key(secret_key: str, algorithm: str) -> jwt.PyJWK:
+    return jwt.PyJWK({"kty": "oct", "k": base64url_encode(secret_key.encode()).decode()}, algorithm=algorithm)
+
+
+def get_signing_key() -> jwt.PyJWK:
+    """Get the prepared key used to sign and verify access tokens."""
+    settings = get_settings()
+    return _build_signing_key(settings.secret_key, settings.access_token_hashing_algorithm)
+
+
 def create_access_token(user: User) -> str:
     settings = get_settings()
-    token_payload = {
-        "sub": str(user.id),
-        "exp": datetime.now(timezone.utc) + timedelta(minutes=settings.access_token_expire_minutes),
-    }
-    return jwt.encode(token_payload, settings.secret_key, algorithm=settings.access_token_hashing_algorithm)
+    token_payload = {"sub": str(user.id), "exp": int(time()) + settings.access_token_expire_minutes * 60}
+    return jwt.encode(token_payload, get_signing_key(), algorithm=settings.access_token_hashing_algorithm)
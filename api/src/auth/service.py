@@ -1,5 +1,6 @@
 from pydantic import EmailStr
-from sqlmodel import Session, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import Session, exists, select
 
 from .models import User, UserCreate, UserUpdate
 from .security import get_password_hash
@@ -10,7 +11,15 @@ def get_user_by_id(*, session: Session, user_id: int) -> User | None:
 
 
 def get_user_by_email(*, session: Session, email: EmailStr) -> User | None:
-    return session.exec(select(User).where(User.email == email)).one_or_none()
+    # Emails are stored lowercased, so the lookup stays an exact match on the unique index
+    return session.exec(select(User).where(User.email == email.lower())).one_or_none()
+
+
+def email_exists(*, session: Session, email: EmailStr, exclude_user_id: int | None = None) -> bool:
+    query = exists().where(User.email == email.lower())
+    if exclude_user_id is not None:
+        query = query.where(User.id != exclude_user_id)
+    return session.exec(select(query)).one()
 
 
 def get_user_by_google_id(*, session: Session, google_id: str) -> User | None:
@@ -21,29 +30,28 @@ def create_user(*, session: Session, user_in: UserCreate) -> User:
     db_user = User.model_validate(user_in, update={"hashed_password": get_password_hash(user_in.password)})
     session.add(db_user)
     session.commit()
-    session.refresh(db_user)
     return db_user
 
 
 def get_or_create_user_by_google(*, session: Session, google_id: str, email: EmailStr, name: str) -> User:
     if user := get_user_by_google_id(session=session, google_id=google_id):
         return user
-    if user := get_user_by_email(session=session, email=email):
-        user.google_id = google_id
-        session.add(user)
-        session.commit()
-        session.refresh(user)
-        return user
-    db_user = User(email=email, name=name, google_id=google_id)
-    session.add(db_user)
+    statement = (
+        insert(User)
+        .values(email=email.lower(), name=name, google_id=google_id)
+        .on_conflict_do_update(index_elements=[User.email], set_={"google_id": google_id})
+        .returning(User)
+        .execution_options(populate_existing=True)
+    )
+    user = session.scalars(statement).one()
     session.commit()
-    session.refresh(db_user)
-    return db_user
+    return user
 
 
 def update_user(*, session: Session, user: User, user_in: UserUpdate) -> User:
-    user.sqlmodel_update(user_in.model_dump(exclude_unset=True))
+    if not (changes := user_in.model_dump(exclude_unset=True)):
+        return user
+    user.sqlmodel_update(changes)
     session.add(user)
     session.commit()
-    session.refresh(user)
     return user
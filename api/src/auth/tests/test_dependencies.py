@@ -1,9 +1,12 @@
+from time import time
+from unittest.mock import patch
+
 import jwt
 import pytest
 from fastapi import HTTPException
 from sqlmodel import Session
 
-from auth.dependencies import get_authenticated_user
+from auth.dependencies import TOKEN_CACHE_MAX_SIZE, get_authenticated_user, get_token_user_id, token_cache
 from auth.models import User, UserCreate
 from auth.security import create_access_token
 from auth.service import create_user
@@ -79,3 +82,74 @@ class TestGetAuthenticatedUser:
             await get_authenticated_user(session=session, token=token)
         assert exc_info.value.status_code == 401
         assert exc_info.value.detail == "Invalid credentials"
+
+    @pytest.mark.asyncio
+    async def test_reuses_decoded_token(self, session: Session) -> None:
+        user = create_user(
+            session=session, user_in=UserCreate(name="Test User", email="test@example.com", password="password123")
+        )
+        token = create_access_token(user)
+        with patch("auth.dependencies.jwt.decode", wraps=jwt.decode) as decode_mock:
+            first = await get_authenticated_user(session=session, token=token)
+            second = await get_authenticated_user(session=session, token=token)
+        assert first.id == second.id == user.id
+        assert decode_mock.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_decodes_token_again_after_cache_ttl(self, session: Session) -> None:
+        user = create_user(
+            session=session, user_in=UserCreate(name="Test User", email="test@example.com", password="password123")
+        )
+        token = create_access_token(user)
+        settings = get_settings()
+        with patch("auth.dependencies.jwt.decode", wraps=jwt.decode) as decode_mock:
+            await get_authenticated_user(session=session, token=token)
+            with patch("auth.dependencies.time", return_value=time() + settings.access_token_cache_ttl_seconds + 1):
+                result = await get_authenticated_user(session=session, token=token)
+        assert result.id == user.id
+        assert decode_mock.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_does_not_reuse_token_when_cache_disabled(
+        self, session: Session, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("ACCESS_TOKEN_CACHE_TTL_SECONDS", "0")
+        get_settings.cache_clear()
+        user = create_user(
+            session=session, user_in=UserCreate(name="Test User", email="test@example.com", password="password123")
+        )
+        token = create_access_token(user)
+        with patch("auth.dependencies.jwt.decode", wraps=jwt.decode) as decode_mock:
+            await get_authenticated_user(session=session, token=token)
+            await get_authenticated_user(session=session, token=token)
+        assert decode_mock.call_count == 2
+
+
+class TestGetTokenUserIdCache:
+    def test_drops_expired_entry_when_read(self, session: Session) -> None:
+        user = create_user(
+            session=session, user_in=UserCreate(name="Test User", email="test@example.com", password="password123")
+        )
+        token = create_access_token(user)
+        assert get_token_user_id(token) == user.id
+        settings = get_settings()
+
+        with patch("auth.dependencies.time", return_value=time() + settings.access_token_cache_ttl_seconds + 1):
+            with patch("auth.dependencies.jwt.decode", side_effect=jwt.InvalidTokenError):
+                assert get_token_user_id(token) is None
+
+        assert token_cache == {}
+
+    def test_evicts_oldest_entry_when_full(self, session: Session) -> None:
+        user = create_user(
+            session=session, user_in=UserCreate(name="Test User", email="test@example.com", password="password123")
+        )
+        now = time()
+        for i in range(TOKEN_CACHE_MAX_SIZE):
+            token_cache[i.to_bytes(32, "big")] = (1, now + 60)
+
+        assert get_token_user_id(create_access_token(user)) == user.id
+
+        assert len(token_cache) == TOKEN_CACHE_MAX_SIZE
+        assert (0).to_bytes(32, "big") not in token_cache
+        assert (1).to_bytes(32, "big") in token_cache
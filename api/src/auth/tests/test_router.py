@@ -48,6 +48,17 @@ class TestLogin:
         assert "access_token" in data
         assert data["token_type"] == "bearer"
 
+    def test_email_is_case_insensitive(self, client: TestClient) -> None:
+        client.post(
+            "/auth/register/", json={"name": "Login User", "email": "Login@Example.com", "password": "correctpassword"}
+        )
+        response = client.post(
+            "/auth/token/",
+            data={"username": "LOGIN@example.com", "password": "correctpassword"},
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+        )
+        assert response.status_code == 200
+
     def test_wrong_password(self, client: TestClient) -> None:
         client.post(
             "/auth/register/",
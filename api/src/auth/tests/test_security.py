@@ -1,10 +1,11 @@
-from unittest.mock import patch
+from time import time
 
 import jwt
 import pytest
+from pwdlib import PasswordHash
 
 from auth.models import User
-from auth.security import create_access_token, get_password_hash, verify_password
+from auth.security import create_access_token, get_password_hash, get_signing_key, verify_password
 from core.conf import get_settings
 
 
@@ -25,6 +26,13 @@ class TestVerifyPassword:
         assert verify_password("", hashed) is True
         assert verify_password("notempty", hashed) is False
 
+    def test_missing_hash(self) -> None:
+        assert verify_password("mysecretpassword", None) is False
+
+    def test_verifies_legacy_hash_parameters(self) -> None:
+        hashed = PasswordHash.recommended().hash("mysecretpassword")
+        assert verify_password("mysecretpassword", hashed) is True
+
 
 class TestGetPasswordHash:
     def test_returns_hashed_string(self) -> None:
@@ -40,6 +48,12 @@ class TestGetPasswordHash:
         # Argon2 uses random salts, so hashes should differ
         assert hash1 != hash2
 
+    def test_uses_configured_argon2_parameters(self) -> None:
+        settings = get_settings()
+        hashed = get_password_hash("mysecretpassword")
+        expected = f"m={settings.argon2_memory_cost},t={settings.argon2_time_cost},p={settings.argon2_parallelism}"
+        assert expected in hashed
+
 
 class TestCreateAccessToken:
     def test_returns_valid_jwt(self) -> None:
@@ -63,14 +77,17 @@ class TestCreateAccessToken:
         settings = get_settings()
         decoded = jwt.decode(token, settings.secret_key, algorithms=[settings.access_token_hashing_algorithm])
         assert "exp" in decoded
+        assert isinstance(decoded["exp"], int)
+        assert 0 < decoded["exp"] - time() <= settings.access_token_expire_minutes * 60
 
-    def test_expired_token_raises_error(self) -> None:
+    def test_expired_token_raises_error(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("ACCESS_TOKEN_EXPIRE_MINUTES", "-1")
+        get_settings.cache_clear()
         user = User(id=1, name="Test User", email="test@example.com", hashed_password="hashed")
         settings = get_settings()
-        with patch.object(settings, "access_token_expire_minutes", -1):
-            token = create_access_token(user)
-            with pytest.raises(jwt.ExpiredSignatureError):
-                jwt.decode(token, settings.secret_key, algorithms=[settings.access_token_hashing_algorithm])
+        token = create_access_token(user)
+        with pytest.raises(jwt.ExpiredSignatureError):
+            jwt.decode(token, settings.secret_key, algorithms=[settings.access_token_hashing_algorithm])
 
     def test_invalid_secret_raises_error(self) -> None:
         user = User(id=1, name="Test User", email="test@example.com", hashed_password="hashed")
@@ -78,3 +95,14 @@ class TestCreateAccessToken:
         settings = get_settings()
         with pytest.raises(jwt.InvalidSignatureError):
             jwt.decode(token, "wrong-secret-key", algorithms=[settings.access_token_hashing_algorithm])
+
+
+class TestGetSigningKey:
+    def test_reuses_prepared_key(self) -> None:
+        assert get_signing_key() is get_signing_key()
+
+    def test_verifies_tokens_signed_with_secret(self) -> None:
+        settings = get_settings()
+        token = jwt.encode({"sub": "1"}, settings.secret_key, algorithm=settings.access_token_hashing_algorithm)
+        decoded = jwt.decode(token, get_signing_key(), algorithms=[settings.access_token_hashing_algorithm])
+        assert decoded["sub"] == "1"
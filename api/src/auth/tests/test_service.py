@@ -1,8 +1,17 @@
+from unittest.mock import patch
+
 from sqlmodel import Session
 
 from auth.models import UserCreate, UserUpdate
 from auth.security import verify_password
-from auth.service import create_user, get_user_by_email, get_user_by_id, update_user
+from auth.service import (
+    create_user,
+    email_exists,
+    get_or_create_user_by_google,
+    get_user_by_email,
+    get_user_by_id,
+    update_user,
+)
 
 
 class TestGetUserById:
@@ -37,6 +46,31 @@ class TestGetUserByEmail:
         result = get_user_by_email(session=session, email="nonexistent@example.com")
         assert result is None
 
+    def test_ignores_email_case(self, session: Session) -> None:
+        user = create_user(
+            session=session, user_in=UserCreate(name="Test User", email="test@example.com", password="password123")
+        )
+        result = get_user_by_email(session=session, email="Test@Example.COM")
+        assert result is not None
+        assert result.id == user.id
+
+
+class TestEmailExists:
+    def test_true_when_email_taken(self, session: Session) -> None:
+        create_user(
+            session=session, user_in=UserCreate(name="Test User", email="test@example.com", password="password123")
+        )
+        assert email_exists(session=session, email="Test@example.com") is True
+
+    def test_false_when_email_free(self, session: Session) -> None:
+        assert email_exists(session=session, email="nonexistent@example.com") is False
+
+    def test_excludes_given_user(self, session: Session) -> None:
+        user = create_user(
+            session=session, user_in=UserCreate(name="Test User", email="test@example.com", password="password123")
+        )
+        assert email_exists(session=session, email=user.email, exclude_user_id=user.id) is False
+
 
 class TestCreateUser:
     def test_creates_user_with_hashed_password(self, session: Session) -> None:
@@ -48,6 +82,12 @@ class TestCreateUser:
         assert user.hashed_password != user_in.password
         assert verify_password(user_in.password, user.hashed_password) is True
 
+    def test_stores_email_lowercased(self, session: Session) -> None:
+        user = create_user(
+            session=session, user_in=UserCreate(name="Test User", email="Test.User@Example.com", password="password123")
+        )
+        assert user.email == "test.user@example.com"
+
     def test_user_is_persisted(self, session: Session) -> None:
         user_in = UserCreate(name="Test User", email="test@example.com", password="password123")
         user = create_user(session=session, user_in=user_in)
@@ -66,6 +106,45 @@ class TestCreateUser:
         assert user1.id != user2.id
 
 
+class TestGetOrCreateUserByGoogle:
+    def test_creates_new_user(self, session: Session) -> None:
+        user = get_or_create_user_by_google(
+            session=session, google_id="google-123", email="New.User@Example.com", name="New User"
+        )
+        assert user.id is not None
+        assert user.email == "new.user@example.com"
+        assert user.name == "New User"
+        assert user.google_id == "google-123"
+        assert user.hashed_password is None
+
+    def test_links_existing_email_account(self, session: Session) -> None:
+        existing = create_user(
+            session=session, user_in=UserCreate(name="Test User", email="test@example.com", password="password123")
+        )
+        assert existing.google_id is None
+
+        user = get_or_create_user_by_google(
+            session=session, google_id="google-123", email="Test@Example.com", name="Google Name"
+        )
+        assert user.id == existing.id
+        assert user.google_id == "google-123"
+        assert user.name == "Test User"
+
+    def test_returns_user_with_existing_google_id(self, session: Session) -> None:
+        created = get_or_create_user_by_google(
+            session=session, google_id="google-123", email="test@example.com", name="Test User"
+        )
+
+        with patch.object(session, "scalars") as scalars_mock:
+            user = get_or_create_user_by_google(
+                session=session, google_id="google-123", email="other@example.com", name="Other Name"
+            )
+        scalars_mock.assert_not_called()
+        assert user.id == created.id
+        assert user.google_id == "google-123"
+        assert user.email == "test@example.com"
+
+
 class TestUpdateUser:
     def test_updates_name(self, session: Session) -> None:
         user = create_user(
@@ -99,7 +178,9 @@ class TestUpdateUser:
             session=session, user_in=UserCreate(name="Test User", email="test@example.com", password="password123")
         )
         user_in = UserUpdate()
-        updated = update_user(session=session, user=user, user_in=user_in)
+        with patch.object(session, "commit") as commit_mock:
+            updated = update_user(session=session, user=user, user_in=user_in)
+        commit_mock.assert_not_called()
         assert updated.name == user.name
         assert updated.email == user.email
 
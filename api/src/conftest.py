@@ -1,10 +1,13 @@
+import sqlite3
 from collections.abc import Generator
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import Connection, Engine, event
 from sqlmodel import Session, SQLModel, create_engine
 from sqlmodel.pool import StaticPool
 
+from auth.dependencies import token_cache
 from auth.models import User, UserCreate
 from auth.security import create_access_token
 from auth.service import create_user
@@ -19,28 +22,60 @@ type AuthenticatedClient = tuple[TestClient, User]
 def settings_fixture(monkeypatch: pytest.MonkeyPatch) -> Generator[None, None, None]:
     monkeypatch.setenv("DATABASE_DSN", "postgresql+psycopg://dummy")
     monkeypatch.setenv("SECRET_KEY", "test-secret-key")
+    # Cheapest Argon2id profile, tests exercise the hashing flow and not its strength
+    monkeypatch.setenv("ARGON2_TIME_COST", "1")
+    monkeypatch.setenv("ARGON2_MEMORY_COST", "8")
     get_settings.cache_clear()
+    token_cache.clear()
     yield
     get_settings.cache_clear()
+    token_cache.clear()
 
 
-@pytest.fixture(name="session")
-def session_fixture() -> Generator[Session, None, None]:
+@pytest.fixture(name="engine", scope="session")
+def engine_fixture() -> Generator[Engine, None, None]:
     engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+
+    # pysqlite manages transactions itself and breaks SAVEPOINT, so let SQLAlchemy emit BEGIN instead
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection: sqlite3.Connection, _: object) -> None:
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(connection: Connection) -> None:
+        connection.exec_driver_sql("BEGIN")
+
     SQLModel.metadata.create_all(engine)
-    with Session(engine) as session:
-        yield session
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(name="session")
+def session_fixture(engine: Engine) -> Generator[Session, None, None]:
+    # Every test runs inside an outer transaction that is rolled back, service commits only release savepoints
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        with Session(bind=connection, join_transaction_mode="create_savepoint", expire_on_commit=False) as session:
+            yield session
+        transaction.rollback()
+
+
+@pytest.fixture(name="app_client", scope="session")
+def app_client_fixture() -> Generator[TestClient, None, None]:
+    with TestClient(app) as client:
+        yield client
 
 
 @pytest.fixture(name="client")
-def client_fixture(session: Session) -> Generator[TestClient, None, None]:
+def client_fixture(session: Session, app_client: TestClient) -> Generator[TestClient, None, None]:
     def get_session_override() -> Session:
         return session
 
     app.dependency_overrides[get_database_session] = get_session_override
-    client = TestClient(app)
-    yield client
+    yield app_client
     app.dependency_overrides.clear()
+    app_client.headers.pop("Authorization", None)
+    app_client.cookies.clear()
 
 
 @pytest.fixture(name="authenticated_client")
@@ -1,14 +1,24 @@
 from functools import lru_cache
 
 from pydantic import PostgresDsn
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
+    # Shared process-wide through get_settings(), so it must not be mutated after parsing
+    model_config = SettingsConfigDict(frozen=True)
+
     database_dsn: PostgresDsn
+    database_pool_size: int = 5
+    database_max_overflow: int = 10
     secret_key: str
     access_token_hashing_algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
+    access_token_cache_ttl_seconds: int = 30
+    # OWASP recommended Argon2id parameters (19 MiB memory, 2 iterations, 1 degree of parallelism)
+    argon2_time_cost: int = 2
+    argon2_memory_cost: int = 19456
+    argon2_parallelism: int = 1
     debug: bool = False
     google_client_id: str | None = None
     google_client_secret: str | None = None
@@ -16,6 +26,6 @@ class Settings(BaseSettings):
     frontend_url: str = "http://localhost:5173"
 
 
-@lru_cache
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     return Settings()
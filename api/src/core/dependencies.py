@@ -0,0 +1,12 @@
+from typing import Annotated
+
+from fastapi import Depends, Request
+from httpx import AsyncClient
+
+
+async def get_http_client(request: Request) -> AsyncClient:
+    """Get the HTTP client shared across requests for outgoing calls."""
+    return request.app.state.http_client
+
+
+HttpClient = Annotated[AsyncClient, Depends(get_http_client)]
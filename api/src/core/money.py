@@ -1,6 +1,19 @@
 from decimal import Decimal, ROUND_UP
+from typing import Annotated
+
+from pydantic import PlainSerializer
+
+CENT = Decimal("0.01")
+ZERO = Decimal("0.00")
+
+SerializedAmount = Annotated[Decimal, PlainSerializer(float, return_type=float)]
 
 
 def quantize_currency(value: Decimal) -> Decimal:
     """Normalize currency to 2 decimal places, rounding up."""
-    return value.quantize(Decimal("0.01"), rounding=ROUND_UP)
+    return value.quantize(CENT, rounding=ROUND_UP)
+
+
+def to_cents(value: Decimal) -> int:
+    """Convert a currency amount to whole cents, rounding up."""
+    return int(quantize_currency(value).scaleb(2))
@@ -0,0 +1,14 @@
+import pytest
+from pydantic import ValidationError
+
+from core.conf import get_settings
+
+
+class TestGetSettings:
+    def test_returns_cached_instance(self) -> None:
+        assert get_settings() is get_settings()
+
+    def test_settings_are_frozen(self) -> None:
+        settings = get_settings()
+        with pytest.raises(ValidationError):
+            settings.debug = True  # type: ignore[misc]
@@ -6,3 +6,4 @@ class TestCheckAlive:
         response = client.get("/-/alive/")
         assert response.status_code == 200
         assert response.json() == "ok"
+        assert response.headers["content-type"] == "application/json"
@@ -12,11 +12,20 @@ from core.conf import get_settings
 @lru_cache
 def get_engine() -> Engine:
     settings = get_settings()
-    return create_engine(str(settings.database_dsn), echo=settings.debug)
+    return create_engine(
+        str(settings.database_dsn),
+        echo=settings.debug,
+        # Bound parameters include password hashes, keep them out of the SQL echo and error messages
+        hide_parameters=True,
+        pool_size=settings.database_pool_size,
+        max_overflow=settings.database_max_overflow,
+        pool_use_lifo=True,
+    )
 
 
 def get_database_session() -> Generator[Session, None, None]:
-    with Session(get_engine()) as session:
+    # Objects keep their loaded state after commit, so services do not need to reload rows they just wrote
+    with Session(get_engine(), expire_on_commit=False) as session:
         yield session
 
 
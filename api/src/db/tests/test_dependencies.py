@@ -1,8 +1,10 @@
 from collections.abc import Generator
 
+import pytest
 from sqlmodel import Session
 
-from db.dependencies import get_database_session
+from core.conf import get_settings
+from db.dependencies import get_database_session, get_engine
 
 
 class TestGetDatabaseSession:
@@ -18,3 +20,25 @@ class TestGetDatabaseSession:
             next(session_generator)
         except StopIteration:
             pass
+
+    def test_session_does_not_expire_on_commit(self) -> None:
+        session_generator = get_database_session()
+        try:
+            session = next(session_generator)
+            assert session.expire_on_commit is False
+        finally:
+            session_generator.close()
+
+
+class TestGetEngine:
+    def test_hides_bound_parameters(self) -> None:
+        assert get_engine().hide_parameters is True
+
+    def test_uses_configured_pool_size(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("DATABASE_POOL_SIZE", "3")
+        get_settings.cache_clear()
+        get_engine.cache_clear()
+        try:
+            assert get_engine().pool.size() == 3
+        finally:
+            get_engine.cache_clear()
@@ -0,0 +1,16 @@
+from db.utils import split_page_total
+
+
+def _unexpected_count() -> int:
+    raise AssertionError("count should not be called")
+
+
+class TestSplitPageTotal:
+    def test_takes_total_from_rows(self) -> None:
+        assert split_page_total([("a", 5), ("b", 5)], _unexpected_count, past_start=True) == (["a", "b"], 5)
+
+    def test_counts_when_past_the_last_page(self) -> None:
+        assert split_page_total([], lambda: 3, past_start=True) == ([], 3)
+
+    def test_empty_first_page_has_no_total(self) -> None:
+        assert split_page_total([], _unexpected_count, past_start=False) == ([], 0)
@@ -0,0 +1,14 @@
+from collections.abc import Callable, Sequence
+
+
+def split_page_total[T](
+    rows: Sequence[tuple[T, int]], count: Callable[[], int], *, past_start: bool
+) -> tuple[list[T], int]:
+    """
+    Split page rows selected alongside the total row count into the items and that total.
+    A page past the last row has no row to carry the total, so when the page does not start at the beginning
+    the total comes from `count` instead.
+    """
+    if rows:
+        return [item for item, _ in rows], rows[0][1]
+    return [], count() if past_start else 0
@@ -2,7 +2,7 @@ from datetime import UTC, datetime
 from decimal import Decimal
 
 from pydantic import field_validator
-from sqlmodel import Field, SQLModel, UniqueConstraint
+from sqlmodel import Field, Index, SQLModel, UniqueConstraint
 
 from core.money import quantize_currency
 
@@ -23,11 +23,14 @@ class ExpenseBase(SQLModel):
 class Expense(ExpenseBase, table=True):
     """Expense database model."""
 
+    __table_args__ = (Index("ix_expense_group_id_created_at_id", "group_id", "created_at", "id"),)
+
     id: int | None = Field(default=None, primary_key=True)
     group_id: int = Field(foreign_key="expensegroup.id", ondelete="CASCADE")
     created_by: int = Field(foreign_key="user.id")
-    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    # Naive UTC, as stored by the timestamp columns, so instances match what is read back from the database
+    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC).replace(tzinfo=None))
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(UTC).replace(tzinfo=None))
 
 
 class ExpenseSplit(SQLModel, table=True):
@@ -79,3 +82,4 @@ class ExpenseList(SQLModel):
     total: int
     offset: int
     limit: int
+    next_cursor: str | None = None
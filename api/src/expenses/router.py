@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Query, status
+from fastapi import APIRouter, HTTPException, Query, status
+from pydantic import TypeAdapter
 
 from auth.dependencies import AuthenticatedUser
 from db.dependencies import DbSession
@@ -6,10 +7,13 @@ from groups.dependencies import GroupAsMember
 
 from .dependencies import ExpenseAsCreator, ExpenseAsMember
 from .models import ExpenseCreate, ExpenseList, ExpensePublic, ExpenseUpdate
-from .service import count_expenses_for_group, create_expense, delete_expense, get_expenses_for_group, update_expense
+from .service import create_expense, delete_expense, get_expenses_for_group, update_expense
+from .utils import decode_expense_cursor, encode_expense_cursor
 
 router = APIRouter(tags=["expenses"])
 
+_expense_list_adapter = TypeAdapter(list[ExpensePublic])
+
 
 @router.post("/groups/{group_id}/expenses/", response_model=ExpensePublic, status_code=status.HTTP_201_CREATED)
 async def create_group_expense(
@@ -27,13 +31,22 @@ async def list_group_expenses(
     group: GroupAsMember,
     offset: int = Query(default=0, ge=0),
     limit: int = Query(default=20, ge=1, le=100),
+    cursor: str | None = Query(default=None),
 ) -> ExpenseList:
-    """List expenses in a group with pagination. User must be a group member."""
-    expenses = get_expenses_for_group(session=session, group_id=group.id, offset=offset, limit=limit)
-    total = count_expenses_for_group(session=session, group_id=group.id)
-    return ExpenseList(
-        items=[ExpensePublic.model_validate(e) for e in expenses], total=total, offset=offset, limit=limit
+    """
+    List expenses in a group with pagination. User must be a group member.
+    Pass the returned `next_cursor` to get the following page, offset is then applied after the cursor.
+    """
+    try:
+        position = decode_expense_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    expenses, total = get_expenses_for_group(
+        session=session, group_id=group.id, offset=offset, limit=limit, cursor=position
     )
+    items = _expense_list_adapter.validate_python(expenses, from_attributes=True)
+    next_cursor = encode_expense_cursor(expenses[-1]) if len(expenses) == limit else None
+    return ExpenseList(items=items, total=total, offset=offset, limit=limit, next_cursor=next_cursor)
 
 
 @router.get("/expenses/{expense_id}/", response_model=ExpensePublic)
@@ -1,12 +1,30 @@
 from datetime import UTC, datetime
 from decimal import Decimal
 
+from sqlalchemy import DateTime, Integer, Numeric, bindparam, case, delete, insert, literal, tuple_
 from sqlmodel import Session, col, func, select
 
-from core.money import quantize_currency
+from core.money import CENT, to_cents
+from db.utils import split_page_total
 from groups.models import ExpenseGroupMember
 
 from .models import Expense, ExpenseCreate, ExpenseSplit, ExpenseUpdate
+from .utils import ExpenseCursor
+
+
+_expense_count_statement = select(func.count()).select_from(Expense).where(Expense.group_id == bindparam("group_id"))
+# correlate(None) keeps the count from binding to the outer expense row, so it counts the whole group
+_expense_page_statement = (
+    select(Expense, _expense_count_statement.correlate(None).scalar_subquery())
+    .where(Expense.group_id == bindparam("group_id"))
+    .order_by(col(Expense.created_at).desc(), col(Expense.id).desc())
+    .offset(bindparam("offset"))
+    .limit(bindparam("limit"))
+)
+_expense_page_after_cursor_statement = _expense_page_statement.where(
+    tuple_(col(Expense.created_at), col(Expense.id))
+    < tuple_(bindparam("cursor_created_at", type_=DateTime()), bindparam("cursor_id", type_=Integer()))
+)
 
 
 def get_expense_by_id(*, session: Session, expense_id: int) -> Expense | None:
@@ -14,22 +32,39 @@ def get_expense_by_id(*, session: Session, expense_id: int) -> Expense | None:
     return session.get(Expense, expense_id)
 
 
-def get_expenses_for_group(*, session: Session, group_id: int, offset: int = 0, limit: int = 20) -> list[Expense]:
-    """Get paginated expenses for a group."""
+def get_expense_for_member(*, session: Session, expense_id: int, user_id: int) -> Expense | None:
+    """Get an expense by ID if the user is a member of its group."""
     statement = (
         select(Expense)
-        .where(Expense.group_id == group_id)
-        .order_by(col(Expense.created_at).desc())
-        .offset(offset)
-        .limit(limit)
+        .join(ExpenseGroupMember, col(ExpenseGroupMember.group_id) == col(Expense.group_id))
+        .where(Expense.id == expense_id, ExpenseGroupMember.user_id == user_id)
+    )
+    return session.exec(statement).first()
+
+
+def get_expenses_for_group(
+    *, session: Session, group_id: int, offset: int = 0, limit: int = 20, cursor: ExpenseCursor | None = None
+) -> tuple[list[Expense], int]:
+    """
+    Get paginated expenses for a group, most recent first, along with the total number of expenses in the group.
+    With a cursor, returns the expenses after that position, seeking through the index instead of skipping rows.
+    """
+    params = {"group_id": group_id, "offset": offset, "limit": limit}
+    if cursor is None:
+        rows = session.exec(_expense_page_statement, params=params).all()
+    else:
+        cursor_params = {"cursor_created_at": cursor[0], "cursor_id": cursor[1]}
+        rows = session.exec(_expense_page_after_cursor_statement, params=params | cursor_params).all()
+    return split_page_total(
+        rows,
+        lambda: count_expenses_for_group(session=session, group_id=group_id),
+        past_start=bool(offset) or cursor is not None,
     )
-    return list(session.exec(statement).all())
 
 
 def count_expenses_for_group(*, session: Session, group_id: int) -> int:
     """Count total expenses in a group."""
-    statement = select(func.count()).select_from(Expense).where(Expense.group_id == group_id)
-    return session.exec(statement).one()
+    return session.exec(_expense_count_statement, params={"group_id": group_id}).one()
 
 
 def create_expense(*, session: Session, group_id: int, user_id: int, expense_in: ExpenseCreate) -> Expense:
@@ -39,49 +74,36 @@ def create_expense(*, session: Session, group_id: int, user_id: int, expense_in:
     session.flush()
     _create_expense_splits(session=session, expense=db_expense)
     session.commit()
-    session.refresh(db_expense)
     return db_expense
 
 
 def _create_expense_splits(*, session: Session, expense: Expense) -> None:
     """Create equal splits for all current group members."""
-    members_statement = (
-        select(ExpenseGroupMember.user_id)
-        .where(ExpenseGroupMember.group_id == expense.group_id)
-        .order_by(col(ExpenseGroupMember.user_id))
-    )
-    member_ids: list[int] = list(session.exec(members_statement))
-    if not member_ids:
-        return
     if expense.id is None:
         return
 
-    total = quantize_currency(Decimal(expense.value))
-    total_cents = int(total * 100)
-    member_count = len(member_ids)
-    base_share = total_cents // member_count
-    remainder = total_cents % member_count
-
-    splits: list[ExpenseSplit] = []
-    for index, member_id in enumerate(member_ids):
-        share_cents = base_share + (1 if index < remainder else 0)
-        share = quantize_currency(Decimal(share_cents) / Decimal(100))
-        splits.append(ExpenseSplit(expense_id=expense.id, user_id=member_id, share=share))
-
-    session.add_all(splits)
+    # Split in integer cents, the first members in user id order take one extra cent until the remainder is used up
+    total_cents = to_cents(Decimal(expense.value))
+    member_count = func.count().over()
+    position = func.row_number().over(order_by=col(ExpenseGroupMember.user_id))
+    share_cents = total_cents // member_count + case((position <= total_cents % member_count, 1), else_=0)
+    members_statement = select(
+        literal(expense.id), col(ExpenseGroupMember.user_id), share_cents * literal(CENT, Numeric(12, 2))
+    ).where(ExpenseGroupMember.group_id == expense.group_id)
+    session.exec(insert(ExpenseSplit).from_select(["expense_id", "user_id", "share"], members_statement))
 
 
 def update_expense(*, session: Session, expense: Expense, expense_in: ExpenseUpdate) -> Expense:
     """Update an expense."""
     expense.sqlmodel_update(expense_in.model_dump(exclude_unset=True))
-    expense.updated_at = datetime.now(UTC)
+    expense.updated_at = datetime.now(UTC).replace(tzinfo=None)
     session.add(expense)
     session.commit()
-    session.refresh(expense)
     return expense
 
 
 def delete_expense(*, session: Session, expense: Expense) -> None:
     """Delete an expense."""
-    session.delete(expense)
+    # Splits go with it through the ON DELETE CASCADE foreign key, so no rows need loading
+    session.exec(delete(Expense).where(col(Expense.id) == expense.id))
     session.commit()
@@ -1,3 +1,4 @@
+from datetime import datetime
 from decimal import Decimal
 
 from fastapi.testclient import TestClient
@@ -43,8 +44,9 @@ class TestCreateExpense:
         assert data["group_id"] == group_id
         assert data["created_by"] == user.id
         assert "id" in data
-        assert "created_at" in data
-        assert "updated_at" in data
+        # Timestamps are serialized without an offset, the same as when read back from the database
+        assert datetime.fromisoformat(data["created_at"]).tzinfo is None
+        assert datetime.fromisoformat(data["updated_at"]).tzinfo is None
 
     def test_success_without_description(self, authenticated_client: AuthenticatedClient) -> None:
         client, user = authenticated_client
@@ -155,6 +157,36 @@ class TestListExpenses:
         data = response.json()
         assert len(data["items"]) == 1
         assert data["offset"] == 4
+        assert data["next_cursor"] is None
+
+    def test_cursor_pagination(self, authenticated_client: AuthenticatedClient) -> None:
+        client, _ = authenticated_client
+        group_response = client.post("/groups/", json={"name": "Test Group"})
+        group_id = group_response.json()["id"]
+
+        for i in range(5):
+            client.post(f"/groups/{group_id}/expenses/", json={"name": f"Expense {i}", "value": "10.00"})
+
+        names: list[str] = []
+        cursor = None
+        while True:
+            params = {"limit": 2} | ({"cursor": cursor} if cursor else {})
+            data = client.get(f"/groups/{group_id}/expenses/", params=params).json()
+            assert data["total"] == 5
+            names.extend(item["name"] for item in data["items"])
+            if not (cursor := data["next_cursor"]):
+                break
+
+        assert names == [f"Expense {i}" for i in reversed(range(5))]
+
+    def test_invalid_cursor(self, authenticated_client: AuthenticatedClient) -> None:
+        client, _ = authenticated_client
+        group_response = client.post("/groups/", json={"name": "Test Group"})
+        group_id = group_response.json()["id"]
+
+        response = client.get(f"/groups/{group_id}/expenses/", params={"cursor": "not-a-cursor"})
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid cursor"
 
     def test_not_a_member(self, authenticated_client: AuthenticatedClient, session: Session) -> None:
         client, _ = authenticated_client
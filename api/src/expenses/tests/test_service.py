@@ -10,6 +10,7 @@ from expenses.service import (
     create_expense,
     delete_expense,
     get_expense_by_id,
+    get_expense_for_member,
     get_expenses_for_group,
     update_expense,
 )
@@ -83,6 +84,33 @@ class TestCreateExpense:
         assert len(splits) == 2
         assert sum(split.share for split in splits) == Decimal("10.00")
 
+    def test_distributes_remainder_cents(self, session: Session) -> None:
+        user = create_user(
+            session=session, user_in=UserCreate(name="Owner", email="owner@example.com", password="password")
+        )
+        group = create_group(session=session, user=user, group_in=ExpenseGroupCreate(name="Split Group"))
+        assert group.id is not None
+        for index in range(2):
+            member = create_user(
+                session=session,
+                user_in=UserCreate(name=f"Member {index}", email=f"member{index}@example.com", password="password"),
+            )
+            assert member.id is not None
+            add_member(session=session, group=group, user_id=member.id)
+
+        assert user.id is not None
+        expense = create_expense(
+            session=session,
+            group_id=group.id,
+            user_id=user.id,
+            expense_in=ExpenseCreate(name="Dinner", value=Decimal("10.01")),
+        )
+
+        splits = session.exec(
+            select(ExpenseSplit).where(ExpenseSplit.expense_id == expense.id).order_by(ExpenseSplit.user_id)
+        ).all()
+        assert [split.share for split in splits] == [Decimal("3.34"), Decimal("3.34"), Decimal("3.33")]
+
 
 class TestGetExpenseById:
     def test_returns_expense(self, session: Session) -> None:
@@ -109,6 +137,55 @@ class TestGetExpenseById:
         assert expense is None
 
 
+class TestGetExpenseForMember:
+    def test_returns_expense_for_member(self, session: Session) -> None:
+        user = create_user(
+            session=session, user_in=UserCreate(name="Test", email="test@example.com", password="password")
+        )
+        group = create_group(session=session, user=user, group_in=ExpenseGroupCreate(name="Test Group"))
+        assert group.id is not None
+        assert user.id is not None
+        created = create_expense(
+            session=session,
+            group_id=group.id,
+            user_id=user.id,
+            expense_in=ExpenseCreate(name="Test", value=Decimal("10.00")),
+        )
+
+        assert created.id is not None
+        expense = get_expense_for_member(session=session, expense_id=created.id, user_id=user.id)
+        assert expense is not None
+        assert expense.id == created.id
+
+    def test_returns_none_for_non_member(self, session: Session) -> None:
+        user = create_user(
+            session=session, user_in=UserCreate(name="Test", email="test@example.com", password="password")
+        )
+        other = create_user(
+            session=session, user_in=UserCreate(name="Other", email="other@example.com", password="password")
+        )
+        group = create_group(session=session, user=user, group_in=ExpenseGroupCreate(name="Test Group"))
+        assert group.id is not None
+        assert user.id is not None
+        assert other.id is not None
+        created = create_expense(
+            session=session,
+            group_id=group.id,
+            user_id=user.id,
+            expense_in=ExpenseCreate(name="Test", value=Decimal("10.00")),
+        )
+
+        assert created.id is not None
+        assert get_expense_for_member(session=session, expense_id=created.id, user_id=other.id) is None
+
+    def test_returns_none_when_not_found(self, session: Session) -> None:
+        user = create_user(
+            session=session, user_in=UserCreate(name="Test", email="test@example.com", password="password")
+        )
+        assert user.id is not None
+        assert get_expense_for_member(session=session, expense_id=99999, user_id=user.id) is None
+
+
 class TestGetExpensesForGroup:
     def test_returns_expenses_ordered_by_date(self, session: Session) -> None:
         user = create_user(
@@ -132,8 +209,9 @@ class TestGetExpensesForGroup:
             expense_in=ExpenseCreate(name="Second", value=Decimal("20.00")),
         )
 
-        expenses = get_expenses_for_group(session=session, group_id=group.id)
+        expenses, total = get_expenses_for_group(session=session, group_id=group.id)
         assert len(expenses) == 2
+        assert total == 2
         # Most recent first
         assert expenses[0].name == "Second"
         assert expenses[1].name == "First"
@@ -154,17 +232,47 @@ class TestGetExpensesForGroup:
                 expense_in=ExpenseCreate(name=f"Expense {i}", value=Decimal("10.00")),
             )
 
-        first_page = get_expenses_for_group(session=session, group_id=group.id, offset=0, limit=2)
+        first_page, total = get_expenses_for_group(session=session, group_id=group.id, offset=0, limit=2)
         assert len(first_page) == 2
+        assert total == 5
 
-        second_page = get_expenses_for_group(session=session, group_id=group.id, offset=2, limit=2)
+        second_page, total = get_expenses_for_group(session=session, group_id=group.id, offset=2, limit=2)
         assert len(second_page) == 2
+        assert total == 5
 
         # No overlap between pages
         first_ids = {e.id for e in first_page}
         second_ids = {e.id for e in second_page}
         assert first_ids.isdisjoint(second_ids)
 
+    def test_returns_total_past_last_page(self, session: Session) -> None:
+        user = create_user(
+            session=session, user_in=UserCreate(name="Test", email="test@example.com", password="password")
+        )
+        group = create_group(session=session, user=user, group_in=ExpenseGroupCreate(name="Test Group"))
+
+        assert group.id is not None
+        assert user.id is not None
+        create_expense(
+            session=session,
+            group_id=group.id,
+            user_id=user.id,
+            expense_in=ExpenseCreate(name="Only", value=Decimal("10.00")),
+        )
+
+        expenses, total = get_expenses_for_group(session=session, group_id=group.id, offset=5)
+        assert expenses == []
+        assert total == 1
+
+    def test_returns_zero_total_for_empty_group(self, session: Session) -> None:
+        user = create_user(
+            session=session, user_in=UserCreate(name="Test", email="test@example.com", password="password")
+        )
+        group = create_group(session=session, user=user, group_in=ExpenseGroupCreate(name="Test Group"))
+
+        assert group.id is not None
+        assert get_expenses_for_group(session=session, group_id=group.id) == ([], 0)
+
 
 class TestCountExpensesForGroup:
     def test_counts_expenses(self, session: Session) -> None:
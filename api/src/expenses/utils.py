@@ -0,0 +1,22 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+
+from .models import Expense
+
+type ExpenseCursor = tuple[datetime, int]
+
+
+def encode_expense_cursor(expense: Expense) -> str:
+    """Encode the position right after an expense as an opaque pagination cursor."""
+    payload = json.dumps([expense.created_at.isoformat(), expense.id], separators=(",", ":"))
+    return urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_expense_cursor(cursor: str) -> ExpenseCursor:
+    """Decode a cursor created by `encode_expense_cursor`, raising ValueError when it is malformed."""
+    try:
+        created_at, expense_id = json.loads(urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(created_at), int(expense_id)
+    except (TypeError, ValueError) as exc:
+        raise ValueError("Invalid cursor") from exc
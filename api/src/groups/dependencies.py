@@ -6,7 +6,7 @@ from auth.dependencies import AuthenticatedUser
 from db.dependencies import DbSession
 
 from .models import ExpenseGroup
-from .service import get_group_by_id, is_member
+from .service import get_group_for_member
 
 
 async def get_group_as_member(
@@ -16,8 +16,8 @@ async def get_group_as_member(
     Dependency that fetches a group and verifies the user is a member.
     Returns 404 if group doesn't exist or user is not a member.
     """
-    group = get_group_by_id(session=session, group_id=group_id)
-    if not group or not is_member(session=session, group_id=group_id, user_id=authenticated_user.id):
+    group = get_group_for_member(session=session, group_id=group_id, user_id=authenticated_user.id)
+    if not group:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Group not found")
     return group
 
@@ -30,8 +30,8 @@ async def get_group_as_owner(
     Returns 404 if group doesn't exist or user is not a member.
     Returns 403 if user is a member but not the owner.
     """
-    group = get_group_by_id(session=session, group_id=group_id)
-    if not group or not is_member(session=session, group_id=group_id, user_id=authenticated_user.id):
+    group = get_group_for_member(session=session, group_id=group_id, user_id=authenticated_user.id)
+    if not group:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Group not found")
     if group.created_by != authenticated_user.id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to modify this group")
@@ -2,10 +2,10 @@ from datetime import UTC, datetime
 from decimal import Decimal
 from enum import Enum
 
-from pydantic import EmailStr, field_serializer, field_validator
-from sqlmodel import Field, SQLModel, UniqueConstraint
+from pydantic import EmailStr, field_validator
+from sqlmodel import Field, Index, SQLModel, UniqueConstraint
 
-from core.money import quantize_currency
+from core.money import SerializedAmount, quantize_currency
 from .utils import _validate_group_name, normalize_invite_code
 
 
@@ -40,10 +40,15 @@ class JoinRequestStatus(str, Enum):
 
 
 class ExpenseGroupJoinRequest(SQLModel, table=True):
+    __table_args__ = (
+        Index("ix_expensegroupjoinrequest_group_id_status", "group_id", "status"),
+        Index("ix_expensegroupjoinrequest_user_id_status", "user_id", "status"),
+    )
+
     id: int | None = Field(default=None, primary_key=True)
-    group_id: int = Field(foreign_key="expensegroup.id", index=True, ondelete="CASCADE")
-    user_id: int = Field(foreign_key="user.id", index=True)
-    status: JoinRequestStatus = Field(default="pending", index=True)
+    group_id: int = Field(foreign_key="expensegroup.id", ondelete="CASCADE")
+    user_id: int = Field(foreign_key="user.id")
+    status: JoinRequestStatus = Field(default="pending")
     created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
     resolved_at: datetime | None = Field(default=None)
     resolved_by: int | None = Field(default=None, foreign_key="user.id")
@@ -90,57 +95,33 @@ class ExpenseGroupSettlementPublic(SQLModel):
     created_by: int
     debtor_id: int
     creditor_id: int
-    amount: Decimal
+    amount: SerializedAmount
     created_at: datetime
 
-    @field_serializer("amount")
-    def _serialize_amount(self, amount: Decimal) -> float:
-        return float(amount)
-
 
 class ExpenseGroupDebtItem(SQLModel):
     user_id: int
-    amount: Decimal
-
-    @field_serializer("amount")
-    def _serialize_amount(self, amount: Decimal) -> float:
-        return float(amount)
+    amount: SerializedAmount
 
 
 class ExpenseGroupListItem(ExpenseGroupPublic):
     created_at: datetime
     expense_count: int
-    owed_by_user_total: Decimal
-    owed_to_user_total: Decimal
+    owed_by_user_total: SerializedAmount
+    owed_to_user_total: SerializedAmount
     last_activity_at: datetime | None
 
-    @field_serializer("owed_by_user_total")
-    def _serialize_owed_by_user_total(self, owed_by_user_total: Decimal) -> float:
-        return float(owed_by_user_total)
-
-    @field_serializer("owed_to_user_total")
-    def _serialize_owed_to_user_total(self, owed_to_user_total: Decimal) -> float:
-        return float(owed_to_user_total)
-
 
 class ExpenseGroupDetail(ExpenseGroupPublic):
     members: list[ExpenseGroupMemberPublic] = []
     created_at: datetime
     expense_count: int
-    owed_by_user_total: Decimal
-    owed_to_user_total: Decimal
+    owed_by_user_total: SerializedAmount
+    owed_to_user_total: SerializedAmount
     owed_by_user: list[ExpenseGroupDebtItem] = []
     owed_to_user: list[ExpenseGroupDebtItem] = []
     last_activity_at: datetime | None
 
-    @field_serializer("owed_by_user_total")
-    def _serialize_owed_by_user_total(self, owed_by_user_total: Decimal) -> float:
-        return float(owed_by_user_total)
-
-    @field_serializer("owed_to_user_total")
-    def _serialize_owed_to_user_total(self, owed_to_user_total: Decimal) -> float:
-        return float(owed_to_user_total)
-
 
 class JoinGroupRequest(SQLModel):
     code: str
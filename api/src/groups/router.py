@@ -1,4 +1,5 @@
 from fastapi import APIRouter, HTTPException, Query, Response, status
+from pydantic import TypeAdapter
 
 from auth.dependencies import AuthenticatedUser
 from db.dependencies import DbSession
@@ -15,10 +16,11 @@ from .models import (
     GroupSettlementCreate,
     JoinGroupRequest,
     JoinGroupRequestPublic,
+    JoinGroupRequesterPublic,
     JoinRequestStatus,
 )
 from .service import (
-    add_member,
+    accept_join_request,
     calculate_user_debts,
     calculate_user_debt_totals,
     create_group,
@@ -26,16 +28,13 @@ from .service import (
     create_join_request_by_invite_code,
     delete_group,
     get_group_detail,
-    get_group_expense_counts,
-    get_group_last_activity_by_group,
+    get_group_activity_by_group,
     get_group_list_item,
-    get_group_settlements_count,
     get_group_settlements_paginated,
-    get_join_request_by_id,
     get_join_request_public,
-    get_member,
-    get_user_groups_count,
+    get_join_request_with_requester,
     get_user_groups_paginated,
+    is_member,
     list_join_requests,
     resolve_join_request,
     update_group,
@@ -43,6 +42,8 @@ from .service import (
 
 router = APIRouter(prefix="/groups", tags=["groups"])
 
+_settlement_list_adapter = TypeAdapter(list[ExpenseGroupSettlementPublic])
+
 
 @router.post("/", response_model=ExpenseGroupDetail, status_code=status.HTTP_201_CREATED)
 async def create_expense_group(
@@ -62,19 +63,14 @@ async def list_expense_groups(
     limit: int = Query(default=12, ge=1, le=100),
 ) -> PaginatedResponse[ExpenseGroupListItem]:
     """List expense groups where the authenticated user is a member with pagination."""
-    total = get_user_groups_count(session=session, user_id=authenticated_user.id)
-    groups = get_user_groups_paginated(session=session, user_id=authenticated_user.id, offset=offset, limit=limit)
+    groups, total = get_user_groups_paginated(
+        session=session, user_id=authenticated_user.id, offset=offset, limit=limit
+    )
     group_ids = [group.id for group in groups if group.id is not None]
     totals_by_group = calculate_user_debt_totals(session=session, group_ids=group_ids, user_id=authenticated_user.id)
-    expense_counts = get_group_expense_counts(session=session, group_ids=group_ids)
-    last_activity_by_group = get_group_last_activity_by_group(session=session, group_ids=group_ids)
+    activity_by_group = get_group_activity_by_group(session=session, group_ids=group_ids)
     items = [
-        get_group_list_item(
-            group=group,
-            totals_by_group=totals_by_group,
-            expense_counts=expense_counts,
-            last_activity_by_group=last_activity_by_group,
-        )
+        get_group_list_item(group=group, totals_by_group=totals_by_group, activity_by_group=activity_by_group)
         for group in groups
     ]
     return PaginatedResponse[ExpenseGroupListItem](items=items, total=total, offset=offset, limit=limit)
@@ -98,9 +94,8 @@ async def list_group_settlements(
     limit: int = Query(default=10, ge=1, le=100),
 ) -> PaginatedResponse[ExpenseGroupSettlementPublic]:
     """List settlements in a group with pagination."""
-    total = get_group_settlements_count(session=session, group_id=group.id)
-    settlements = get_group_settlements_paginated(session=session, group_id=group.id, offset=offset, limit=limit)
-    items = [ExpenseGroupSettlementPublic.model_validate(settlement) for settlement in settlements]
+    settlements, total = get_group_settlements_paginated(session=session, group_id=group.id, offset=offset, limit=limit)
+    items = _settlement_list_adapter.validate_python(settlements, from_attributes=True)
     return PaginatedResponse[ExpenseGroupSettlementPublic](items=items, total=total, offset=offset, limit=limit)
 
 
@@ -144,9 +139,10 @@ async def join_group_by_code(
     if not created:
         response.status_code = status.HTTP_200_OK
 
-    if join_request.id is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Join request not found")
-    join_request_public = get_join_request_public(session=session, request_id=join_request.id)
+    requester = JoinGroupRequesterPublic(
+        user_id=authenticated_user.id, name=authenticated_user.name, email=authenticated_user.email
+    )
+    join_request_public = get_join_request_public(request=join_request, requester=requester)
     if not join_request_public:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Join request not found")
     return join_request_public
@@ -170,22 +166,15 @@ async def accept_group_join_request(
     """Accept a join request and add the user to the group."""
     if group.id is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Group not found")
-    join_request = get_join_request_by_id(session=session, request_id=request_id)
-    if not join_request or join_request.group_id != group.id:
+    result = get_join_request_with_requester(session=session, request_id=request_id)
+    if not result or result[0].group_id != group.id:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Join request not found")
+    join_request, requester = result
     if join_request.status != JoinRequestStatus.PENDING:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Join request already resolved")
 
-    resolve_join_request(
-        session=session, request=join_request, status=JoinRequestStatus.ACCEPTED, resolved_by=authenticated_user.id
-    )
-    if join_request.user_id is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Join request not found")
-    if not get_member(session=session, group_id=group.id, user_id=join_request.user_id):
-        add_member(session=session, group=group, user_id=join_request.user_id)
-    if join_request.id is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Join request not found")
-    join_request_public = get_join_request_public(session=session, request_id=join_request.id)
+    accept_join_request(session=session, group=group, request=join_request, resolved_by=authenticated_user.id)
+    join_request_public = get_join_request_public(request=join_request, requester=requester)
     if not join_request_public:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Join request not found")
     return join_request_public
@@ -196,18 +185,17 @@ async def decline_group_join_request(
     *, session: DbSession, group: GroupAsOwner, authenticated_user: AuthenticatedUser, request_id: int
 ) -> JoinGroupRequestPublic:
     """Decline a join request for a group."""
-    join_request = get_join_request_by_id(session=session, request_id=request_id)
-    if not join_request or join_request.group_id != group.id:
+    result = get_join_request_with_requester(session=session, request_id=request_id)
+    if not result or result[0].group_id != group.id:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Join request not found")
+    join_request, requester = result
     if join_request.status != JoinRequestStatus.PENDING:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Join request already resolved")
 
     resolve_join_request(
         session=session, request=join_request, status=JoinRequestStatus.DECLINED, resolved_by=authenticated_user.id
     )
-    if join_request.id is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Join request not found")
-    join_request_public = get_join_request_public(session=session, request_id=join_request.id)
+    join_request_public = get_join_request_public(request=join_request, requester=requester)
     if not join_request_public:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Join request not found")
     return join_request_public
@@ -225,7 +213,7 @@ async def create_group_settlement_payment(
     if settlement_in.creditor_id == authenticated_user.id:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Creditor must be a different group member")
 
-    if not get_member(session=session, group_id=group.id, user_id=settlement_in.creditor_id):
+    if not is_member(session=session, group_id=group.id, user_id=settlement_in.creditor_id):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Member not found")
 
     owed_by_total, _, owed_by_user, _ = calculate_user_debts(
@@ -3,11 +3,12 @@ from collections import defaultdict
 from decimal import Decimal
 
 from sqlalchemy import case, or_
-from sqlmodel import Session, col, func, select
+from sqlmodel import Session, col, exists, func, select
 
 from auth.models import User
 
-from core.money import quantize_currency
+from core.money import ZERO, quantize_currency
+from db.utils import split_page_total
 from expenses.models import Expense, ExpenseSplit
 
 from .models import (
@@ -36,6 +37,16 @@ def get_group_by_id(*, session: Session, group_id: int) -> ExpenseGroup | None:
     return session.get(ExpenseGroup, group_id)
 
 
+def get_group_for_member(*, session: Session, group_id: int, user_id: int) -> ExpenseGroup | None:
+    """Get an expense group by ID if the user is one of its members."""
+    statement = (
+        select(ExpenseGroup)
+        .join(ExpenseGroupMember, col(ExpenseGroupMember.group_id) == col(ExpenseGroup.id))
+        .where(ExpenseGroup.id == group_id, ExpenseGroupMember.user_id == user_id)
+    )
+    return session.exec(statement).first()
+
+
 def get_user_groups(*, session: Session, user_id: int) -> list[ExpenseGroup]:
     """Get all expense groups where user is a member."""
     statement = (
@@ -53,9 +64,12 @@ def create_group(*, session: Session, user: User, group_in: ExpenseGroupCreate)
     invite_code = ensure_invite_code_unique(session=session)
     db_group = ExpenseGroup.model_validate(group_in, update={"created_by": user.id, "invite_code": invite_code})
     session.add(db_group)
+    session.flush()
+    if db_group.id is None:
+        raise ValueError("Group not found")
+    session.add(ExpenseGroupMember(group_id=db_group.id, user_id=user.id))
     session.commit()
     session.refresh(db_group)
-    add_member(session=session, group=db_group, user_id=user.id)
     return db_group
 
 
@@ -93,7 +107,10 @@ def get_join_request_by_id(*, session: Session, request_id: int) -> ExpenseGroup
     return session.get(ExpenseGroupJoinRequest, request_id)
 
 
-def get_join_request_public(*, session: Session, request_id: int) -> JoinGroupRequestPublic | None:
+def get_join_request_with_requester(
+    *, session: Session, request_id: int
+) -> tuple[ExpenseGroupJoinRequest, JoinGroupRequesterPublic] | None:
+    """Get a join request along with the public details of the user who made it."""
     statement = (
         select(ExpenseGroupJoinRequest, User.id, User.name, User.email)
         .join(User, col(ExpenseGroupJoinRequest.user_id) == col(User.id))
@@ -103,18 +120,23 @@ def get_join_request_public(*, session: Session, request_id: int) -> JoinGroupRe
     if not result:
         return None
     request, user_id, name, email = result
-    if request.id is None or request.group_id is None:
-        return None
-    if user_id is None:
-        return None
     if name is None or email is None:
         return None
+    return request, JoinGroupRequesterPublic(user_id=user_id, name=name, email=email)
+
+
+def get_join_request_public(
+    *, request: ExpenseGroupJoinRequest, requester: JoinGroupRequesterPublic
+) -> JoinGroupRequestPublic | None:
+    """Build the public view of a join request from its already loaded requester, without querying again."""
+    if request.id is None or request.group_id is None:
+        return None
     return JoinGroupRequestPublic(
         id=request.id,
         group_id=request.group_id,
         status=request.status,
         created_at=request.created_at,
-        requester=JoinGroupRequesterPublic(user_id=user_id, name=name, email=email),
+        requester=requester,
     )
 
 
@@ -213,7 +235,22 @@ def resolve_join_request(
     request.resolved_by = resolved_by
     session.add(request)
     session.commit()
-    session.refresh(request)
+    return request
+
+
+def accept_join_request(
+    *, session: Session, group: ExpenseGroup, request: ExpenseGroupJoinRequest, resolved_by: int
+) -> ExpenseGroupJoinRequest:
+    """Accept a join request and add the requester to the group, committing both together."""
+    if group.id is None:
+        raise ValueError("Group not found")
+    request.status = JoinRequestStatus.ACCEPTED
+    request.resolved_at = datetime.now(UTC)
+    request.resolved_by = resolved_by
+    session.add(request)
+    if not is_member(session=session, group_id=group.id, user_id=request.user_id):
+        session.add(ExpenseGroupMember(group_id=group.id, user_id=request.user_id))
+    session.commit()
     return request
 
 
@@ -228,7 +265,8 @@ def ensure_invite_code_unique(*, session: Session) -> str:
 
 def is_member(*, session: Session, group_id: int, user_id: int) -> bool:
     """Check if a user is a member of a group."""
-    return get_member(session=session, group_id=group_id, user_id=user_id) is not None
+    query = exists().where(ExpenseGroupMember.group_id == group_id, ExpenseGroupMember.user_id == user_id)
+    return session.exec(select(query)).one()
 
 
 def add_member(*, session: Session, group: ExpenseGroup, user_id: int) -> ExpenseGroupMember:
@@ -275,17 +313,24 @@ def get_user_groups_count(*, session: Session, user_id: int) -> int:
 
 def get_user_groups_paginated(
     *, session: Session, user_id: int, offset: int = 0, limit: int = 12
-) -> list[ExpenseGroup]:
-    """Get paginated expense groups where user is a member, sorted by creation date."""
+) -> tuple[list[ExpenseGroup], int]:
+    """
+    Get paginated expense groups where user is a member, sorted by creation date,
+    along with the total number of groups the user is a member of.
+    """
+    # The window count is taken before OFFSET/LIMIT apply, so every row carries the full total
     statement = (
-        select(ExpenseGroup)
+        select(ExpenseGroup, func.count().over())
         .join(ExpenseGroupMember, col(ExpenseGroup.id) == col(ExpenseGroupMember.group_id))
         .where(ExpenseGroupMember.user_id == user_id)
         .order_by(col(ExpenseGroup.created_at).desc())
         .offset(offset)
         .limit(limit)
     )
-    return list(session.exec(statement).all())
+    rows = session.exec(statement).all()
+    return split_page_total(
+        rows, lambda: get_user_groups_count(session=session, user_id=user_id), past_start=bool(offset)
+    )
 
 
 def get_group_detail(*, session: Session, group: ExpenseGroup, user_id: int | None) -> ExpenseGroupDetail:
@@ -293,10 +338,9 @@ def get_group_detail(*, session: Session, group: ExpenseGroup, user_id: int | No
     if group.id is None:
         raise ValueError("Group not found")
     members = get_group_members(session=session, group_id=group.id)
-    expense_count = get_group_expense_count(session=session, group_id=group.id)
-    last_activity_at = get_group_last_activity(session=session, group_id=group.id)
-    owed_by_user_total = Decimal("0.00")
-    owed_to_user_total = Decimal("0.00")
+    expense_count, last_activity_at = get_group_activity(session=session, group_id=group.id)
+    owed_by_user_total = ZERO
+    owed_to_user_total = ZERO
     owed_by_user: list[ExpenseGroupDebtItem] = []
     owed_to_user: list[ExpenseGroupDebtItem] = []
     if user_id is not None:
@@ -319,16 +363,11 @@ def get_group_detail(*, session: Session, group: ExpenseGroup, user_id: int | No
     )
 
 
-def get_group_expense_count(*, session: Session, group_id: int) -> int:
-    """Count total expenses in a group."""
-    statement = select(func.count()).select_from(Expense).where(Expense.group_id == group_id)
-    return session.exec(statement).one()
-
-
-def get_group_last_activity(*, session: Session, group_id: int) -> datetime | None:
-    """Get last activity timestamp for a group."""
-    statement = select(func.max(Expense.created_at)).where(Expense.group_id == group_id)
-    return session.exec(statement).one()
+def get_group_activity(*, session: Session, group_id: int) -> tuple[int, datetime | None]:
+    """Get the expense count and last activity timestamp for a group."""
+    statement = select(func.count(), func.max(Expense.created_at)).where(Expense.group_id == group_id)
+    expense_count, last_activity_at = session.exec(statement).one()
+    return expense_count, last_activity_at
 
 
 def get_group_settlements_count(*, session: Session, group_id: int) -> int:
@@ -342,58 +381,52 @@ def get_group_settlements_count(*, session: Session, group_id: int) -> int:
 
 def get_group_settlements_paginated(
     *, session: Session, group_id: int, offset: int = 0, limit: int = 20
-) -> list[ExpenseGroupSettlement]:
-    """Get paginated settlements in a group, sorted by newest first."""
+) -> tuple[list[ExpenseGroupSettlement], int]:
+    """
+    Get paginated settlements in a group, sorted by newest first,
+    along with the total number of settlements in the group.
+    """
 
-    statement = select(ExpenseGroupSettlement).where(ExpenseGroupSettlement.group_id == group_id)
+    statement = select(ExpenseGroupSettlement, func.count().over()).where(ExpenseGroupSettlement.group_id == group_id)
 
     statement = (
         statement.order_by(col(ExpenseGroupSettlement.created_at).desc(), col(ExpenseGroupSettlement.id).desc())
         .offset(offset)
         .limit(limit)
     )
-    return list(session.exec(statement).all())
-
-
-def get_group_expense_counts(*, session: Session, group_ids: list[int]) -> dict[int, int]:
-    """Get total expenses per group."""
-    if not group_ids:
-        return {}
-
-    statement = (
-        select(col(Expense.group_id), func.count())
-        .where(col(Expense.group_id).in_(group_ids))
-        .group_by(col(Expense.group_id))
+    rows = session.exec(statement).all()
+    return split_page_total(
+        rows, lambda: get_group_settlements_count(session=session, group_id=group_id), past_start=bool(offset)
     )
-    return {group_id: count for group_id, count in session.exec(statement).all()}
 
 
-def get_group_last_activity_by_group(*, session: Session, group_ids: list[int]) -> dict[int, datetime | None]:
-    """Get last activity timestamp per group."""
+def get_group_activity_by_group(*, session: Session, group_ids: list[int]) -> dict[int, tuple[int, datetime | None]]:
+    """Get the expense count and last activity timestamp per group."""
     if not group_ids:
         return {}
 
     statement = (
-        select(col(Expense.group_id), func.max(Expense.created_at))
+        select(col(Expense.group_id), func.count(), func.max(Expense.created_at))
         .where(col(Expense.group_id).in_(group_ids))
         .group_by(col(Expense.group_id))
     )
-    return {group_id: last_activity for group_id, last_activity in session.exec(statement).all()}
+    return {
+        group_id: (expense_count, last_activity_at)
+        for group_id, expense_count, last_activity_at in session.exec(statement).all()
+    }
 
 
 def get_group_list_item(
     *,
     group: ExpenseGroup,
     totals_by_group: dict[int, tuple[Decimal, Decimal]],
-    expense_counts: dict[int, int],
-    last_activity_by_group: dict[int, datetime | None],
+    activity_by_group: dict[int, tuple[int, datetime | None]],
 ) -> ExpenseGroupListItem:
     """Get expense group list item for a user with totals."""
     if group.id is None:
         raise ValueError("Group not found")
-    expense_count = expense_counts.get(group.id, 0)
-    last_activity_at = last_activity_by_group.get(group.id)
-    owed_by_user_total, owed_to_user_total = totals_by_group.get(group.id, (Decimal("0.00"), Decimal("0.00")))
+    expense_count, last_activity_at = activity_by_group.get(group.id, (0, None))
+    owed_by_user_total, owed_to_user_total = totals_by_group.get(group.id, (ZERO, ZERO))
     return ExpenseGroupListItem(
         id=group.id,
         name=group.name,
@@ -412,8 +445,8 @@ def calculate_user_debts(
 ) -> tuple[Decimal, Decimal, list[ExpenseGroupDebtItem], list[ExpenseGroupDebtItem]]:
     """Calculate netted debts for a user based on group settlement plan."""
     transfers = _calculate_group_settlement_plan(session=session, group_id=group_id)
-    owed_by_raw: dict[int, Decimal] = defaultdict(lambda: Decimal("0.00"))
-    owed_to_raw: dict[int, Decimal] = defaultdict(lambda: Decimal("0.00"))
+    owed_by_raw: dict[int, Decimal] = defaultdict(lambda: ZERO)
+    owed_to_raw: dict[int, Decimal] = defaultdict(lambda: ZERO)
     for debtor_id, creditor_id, amount in transfers:
         if debtor_id == user_id:
             owed_by_raw[creditor_id] += amount
@@ -433,7 +466,7 @@ def _calculate_group_settlement_plan(*, session: Session, group_id: int) -> list
         .group_by(col(ExpenseSplit.user_id), col(Expense.created_by))
     )
 
-    balances: dict[int, Decimal] = defaultdict(lambda: Decimal("0.00"))
+    balances: dict[int, Decimal] = defaultdict(lambda: ZERO)
     for debtor_id, creditor_id, amount in session.exec(statement).all():
         amount_decimal = Decimal(str(amount))
         balances[debtor_id] -= amount_decimal
@@ -453,9 +486,9 @@ def _calculate_group_settlement_plan(*, session: Session, group_id: int) -> list
     debtors: list[tuple[int, Decimal]] = []
     creditors: list[tuple[int, Decimal]] = []
     for user_id, balance in balances.items():
-        if balance > Decimal("0.00"):
+        if balance > ZERO:
             creditors.append((user_id, balance))
-        elif balance < Decimal("0.00"):
+        elif balance < ZERO:
             debtors.append((user_id, -balance))
 
     debtors.sort(key=lambda item: (-item[1], item[0]))
@@ -468,18 +501,18 @@ def _calculate_group_settlement_plan(*, session: Session, group_id: int) -> list
         debtor_id, debtor_amount = debtors[debtor_index]
         creditor_id, creditor_amount = creditors[creditor_index]
         transfer_amount = quantize_currency(min(debtor_amount, creditor_amount))
-        if transfer_amount > Decimal("0.00"):
+        if transfer_amount > ZERO:
             transfers.append((debtor_id, creditor_id, transfer_amount))
 
         remaining_debtor = quantize_currency(debtor_amount - transfer_amount)
         remaining_creditor = quantize_currency(creditor_amount - transfer_amount)
 
-        if remaining_debtor == Decimal("0.00"):
+        if remaining_debtor == ZERO:
             debtor_index += 1
         else:
             debtors[debtor_index] = (debtor_id, remaining_debtor)
 
-        if remaining_creditor == Decimal("0.00"):
+        if remaining_creditor == ZERO:
             creditor_index += 1
         else:
             creditors[creditor_index] = (creditor_id, remaining_creditor)
@@ -514,7 +547,7 @@ def calculate_user_debt_totals(
     expense_balances = _get_user_expense_balance_by_group(session=session, group_ids=group_ids, user_id=user_id)
     settlement_balances = _get_user_settlement_balance_by_group(session=session, group_ids=group_ids, user_id=user_id)
 
-    balance_by_group: dict[int, Decimal] = defaultdict(lambda: Decimal("0.00"))
+    balance_by_group: dict[int, Decimal] = defaultdict(lambda: ZERO)
     for group_id, balance in expense_balances.items():
         balance_by_group[group_id] += balance
     for group_id, balance in settlement_balances.items():
@@ -591,13 +624,13 @@ def _balances_to_debt_totals(
 ) -> dict[int, tuple[Decimal, Decimal]]:
     totals: dict[int, tuple[Decimal, Decimal]] = {}
     for group_id in group_ids:
-        balance = quantize_currency(balance_by_group.get(group_id, Decimal("0.00")))
-        if balance > Decimal("0.00"):
-            totals[group_id] = (Decimal("0.00"), balance)
-        elif balance < Decimal("0.00"):
-            totals[group_id] = (quantize_currency(-balance), Decimal("0.00"))
+        balance = quantize_currency(balance_by_group.get(group_id, ZERO))
+        if balance > ZERO:
+            totals[group_id] = (ZERO, balance)
+        elif balance < ZERO:
+            totals[group_id] = (quantize_currency(-balance), ZERO)
         else:
-            totals[group_id] = (Decimal("0.00"), Decimal("0.00"))
+            totals[group_id] = (ZERO, ZERO)
 
     return totals
 
@@ -607,12 +640,12 @@ def _net_user_debts(
 ) -> tuple[Decimal, Decimal, list[ExpenseGroupDebtItem], list[ExpenseGroupDebtItem]]:
     owed_by_items: list[ExpenseGroupDebtItem] = []
     owed_to_items: list[ExpenseGroupDebtItem] = []
-    owed_by_total = Decimal("0.00")
-    owed_to_total = Decimal("0.00")
+    owed_by_total = ZERO
+    owed_to_total = ZERO
 
     for other_id in set(owed_by_raw) | set(owed_to_raw):
-        owed_by_amount = owed_by_raw.get(other_id, Decimal("0.00"))
-        owed_to_amount = owed_to_raw.get(other_id, Decimal("0.00"))
+        owed_by_amount = owed_by_raw.get(other_id, ZERO)
+        owed_to_amount = owed_to_raw.get(other_id, ZERO)
         if owed_by_amount == owed_to_amount:
             continue
         if owed_by_amount > owed_to_amount:
@@ -9,8 +9,17 @@ from auth.service import create_user
 from conftest import AuthenticatedClient
 from expenses.models import ExpenseCreate
 from expenses.service import create_expense
-from groups.models import ExpenseGroupCreate
-from groups.service import create_group, get_group_by_id, add_member
+from groups.models import ExpenseGroupCreate, JoinRequestStatus
+from groups.service import (
+    accept_join_request,
+    add_member,
+    create_group,
+    create_join_request_by_invite_code,
+    get_group_by_id,
+    get_group_for_member,
+    is_member,
+)
+from groups.utils import INVITE_CODE_ALPHABET, INVITE_CODE_LENGTH, generate_invite_code
 
 
 def create_test_user(session: Session, email: str, name: str = "Test User") -> tuple:
@@ -83,6 +92,45 @@ class TestListGroups:
         assert len(items) == 1
         assert items[0]["name"] == "My Group"
 
+    def test_total_counts_all_pages(self, authenticated_client: AuthenticatedClient) -> None:
+        client, _ = authenticated_client
+        for i in range(3):
+            client.post("/groups/", json={"name": f"Group {i}"})
+
+        response = client.get("/groups/", params={"offset": 2, "limit": 2})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 3
+        assert len(data["items"]) == 1
+
+        response = client.get("/groups/", params={"offset": 5, "limit": 2})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 3
+        assert data["items"] == []
+
+    def test_includes_expense_activity(self, authenticated_client: AuthenticatedClient, session: Session) -> None:
+        client, user = authenticated_client
+        busy_group = create_group(session=session, user=user, group_in=ExpenseGroupCreate(name="Busy Group"))
+        create_group(session=session, user=user, group_in=ExpenseGroupCreate(name="Quiet Group"))
+        assert busy_group.id is not None
+        assert user.id is not None
+        for name in ("Lunch", "Dinner"):
+            create_expense(
+                session=session,
+                group_id=busy_group.id,
+                user_id=user.id,
+                expense_in=ExpenseCreate(name=name, value=Decimal("10.00")),
+            )
+
+        response = client.get("/groups/")
+        assert response.status_code == 200
+        items = {item["name"]: item for item in response.json()["items"]}
+        assert items["Busy Group"]["expense_count"] == 2
+        assert items["Busy Group"]["last_activity_at"] is not None
+        assert items["Quiet Group"]["expense_count"] == 0
+        assert items["Quiet Group"]["last_activity_at"] is None
+
     def test_no_token(self, client: TestClient) -> None:
         response = client.get("/groups/")
         assert response.status_code == 401
@@ -414,6 +462,12 @@ class TestListGroupSettlements:
         assert len(page_two_data["items"]) == 1
         assert page_one_data["items"][0]["id"] != page_two_data["items"][0]["id"]
 
+        past_end = client.get(f"/groups/{group_id}/settlements/?offset=5&limit=1")
+        assert past_end.status_code == 200
+        past_end_data = past_end.json()
+        assert past_end_data["total"] == 2
+        assert past_end_data["items"] == []
+
     def test_rejects_non_member(self, authenticated_client: AuthenticatedClient, session: Session) -> None:
         client, owner = authenticated_client
         create_response = client.post("/groups/", json={"name": "Settlement Access"})
@@ -582,12 +636,18 @@ class TestJoinGroupRequests:
         client.headers["Authorization"] = f"Bearer {requester_token}"
         request_response = client.post("/groups/join/", json={"code": group.invite_code})
         assert request_response.status_code == 201
+        assert request_response.json()["requester"] == {
+            "user_id": requester.id,
+            "name": "Decline User",
+            "email": "decline@example.com",
+        }
         request_id = request_response.json()["id"]
 
         client.headers["Authorization"] = f"Bearer {create_access_token(user=owner)}"
         decline_response = client.post(f"/groups/{group.id}/join-requests/{request_id}/decline/")
         assert decline_response.status_code == 200
         assert decline_response.json()["status"] == "declined"
+        assert decline_response.json()["requester"]["user_id"] == requester.id
 
     def test_declined_request_limit(self, authenticated_client: AuthenticatedClient, session: Session) -> None:
         client, owner = authenticated_client
@@ -618,3 +678,89 @@ class TestJoinGroupRequests:
         response = client.post("/groups/join/", json={"code": group.invite_code})
         assert response.status_code == 400
         assert response.json()["detail"] == "You are already a member of this group"
+
+
+class TestGetGroupForMember:
+    def test_returns_group_for_member(self, session: Session) -> None:
+        user = create_user(
+            session=session, user_in=UserCreate(name="Owner", email="owner@example.com", password="password")
+        )
+        group = create_group(session=session, user=user, group_in=ExpenseGroupCreate(name="Test Group"))
+        assert group.id is not None
+        assert user.id is not None
+
+        result = get_group_for_member(session=session, group_id=group.id, user_id=user.id)
+        assert result is not None
+        assert result.id == group.id
+
+    def test_returns_none_for_non_member(self, session: Session) -> None:
+        owner = create_user(
+            session=session, user_in=UserCreate(name="Owner", email="owner@example.com", password="password")
+        )
+        other = create_user(
+            session=session, user_in=UserCreate(name="Other", email="other@example.com", password="password")
+        )
+        group = create_group(session=session, user=owner, group_in=ExpenseGroupCreate(name="Test Group"))
+        assert group.id is not None
+        assert other.id is not None
+
+        assert get_group_for_member(session=session, group_id=group.id, user_id=other.id) is None
+
+
+class TestAcceptJoinRequest:
+    def test_resolves_request_and_adds_member(self, session: Session) -> None:
+        owner, _ = create_test_user(session, "owner@example.com", "Owner")
+        requester, _ = create_test_user(session, "requester@example.com", "Requester")
+        group = create_group(session=session, user=owner, group_in=ExpenseGroupCreate(name="Test Group"))
+        join_request, _ = create_join_request_by_invite_code(session=session, user=requester, code=group.invite_code)
+        assert group.id is not None
+        assert owner.id is not None
+        assert requester.id is not None
+
+        accept_join_request(session=session, group=group, request=join_request, resolved_by=owner.id)
+
+        assert join_request.status == JoinRequestStatus.ACCEPTED
+        assert join_request.resolved_by == owner.id
+        assert join_request.resolved_at is not None
+        assert is_member(session=session, group_id=group.id, user_id=requester.id)
+
+    def test_keeps_existing_membership(self, session: Session) -> None:
+        owner, _ = create_test_user(session, "owner@example.com", "Owner")
+        requester, _ = create_test_user(session, "requester@example.com", "Requester")
+        group = create_group(session=session, user=owner, group_in=ExpenseGroupCreate(name="Test Group"))
+        join_request, _ = create_join_request_by_invite_code(session=session, user=requester, code=group.invite_code)
+        assert owner.id is not None
+        assert requester.id is not None
+        add_member(session=session, group=group, user_id=requester.id)
+
+        accept_join_request(session=session, group=group, request=join_request, resolved_by=owner.id)
+
+        assert join_request.status == JoinRequestStatus.ACCEPTED
+
+
+class TestIsMember:
+    def test_reports_membership(self, session: Session) -> None:
+        owner = create_user(
+            session=session, user_in=UserCreate(name="Owner", email="owner@example.com", password="password")
+        )
+        other = create_user(
+            session=session, user_in=UserCreate(name="Other", email="other@example.com", password="password")
+        )
+        group = create_group(session=session, user=owner, group_in=ExpenseGroupCreate(name="Test Group"))
+        assert group.id is not None
+        assert owner.id is not None
+        assert other.id is not None
+
+        assert is_member(session=session, group_id=group.id, user_id=owner.id) is True
+        assert is_member(session=session, group_id=group.id, user_id=other.id) is False
+
+
+class TestGenerateInviteCode:
+    def test_uses_invite_code_alphabet(self) -> None:
+        code = generate_invite_code()
+        assert len(code) == INVITE_CODE_LENGTH
+        assert set(code) <= set(INVITE_CODE_ALPHABET)
+
+    def test_generates_distinct_codes(self) -> None:
+        codes = {generate_invite_code() for _ in range(100)}
+        assert len(codes) == 100
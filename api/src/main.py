@@ -1,9 +1,23 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from auth.router import router as auth_router
 from core.router import router as core_router
 from expenses.router import router as expenses_router
 from groups.router import router as groups_router
+from httpx import AsyncClient
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    async with AsyncClient(timeout=10.0) as http_client:
+        app.state.http_client = http_client
+        yield
+
 
 app = FastAPI(
     title="FairShare API",
@@ -12,6 +26,8 @@ app = FastAPI(
     docs_url="/docs/",
     redoc_url="/redoc/",
     openapi_url="/openapi.json/",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -21,6 +37,7 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 app.include_router(core_router)
 app.include_router(auth_router)